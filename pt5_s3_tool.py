@@ -12,10 +12,11 @@ Features:
     - Support for IFCB data file transfers
     - Recursive directory operations
     - Colorized console output
-    - Concurrent file transfers (up to 32 workers)
-    - Connection pool optimization (100 connections)
-    - Automatic retry on failures (3 attempts)
-    - Batched file submission (1000 files per batch)
+    - Concurrent file transfers (up to 128 workers, see --max-workers)
+    - Connection pool sized to the workers (256 by default)
+    - Automatic adaptive retry on failures (up to 10 attempts)
+    - Streaming submission with at most 2 x workers transfers queued
+    - Process-pool ranged downloads for large objects (>= 8 MB)
     - Pre-computed S3 keys for improved performance
     - Overall progress tracking with tqdm
     - Detailed summary report with:
@@ -24,6 +25,9 @@ Features:
         * Transfer duration
         * Average transfer rate
         * Files processed per second
+    - Optional asyncio transfers via aioboto3 (--async)
+    - Optional AWS CRT downloads for large objects via awscrt (--crt)
+    - Optional ETag/MD5 verification of downloads in a process pool (--verify)
     - Dry-run mode for testing
     - Environment variable configuration (automatically used when no args provided)
     - Detailed logging
@@ -31,6 +35,12 @@ Features:
     - Fast bulk deletion of S3 objects
     - Simplified S3 URI handling
 
+Upload Integrity:
+    SigV4 payload signing is disabled, so uploads send UNSIGNED-PAYLOAD
+    instead of a SHA256 of the whole body. This saves a full hashing pass
+    per uploaded byte. TLS still protects the data in transit, and
+    botocore keeps signing payloads on plain-HTTP endpoints.
+
 Environment Variables:
     - IFCB_DATA_DIR: Default source directory for uploads
     - AWS_UPLOAD_URL: Default S3 destination (s3://bucket/prefix)
@@ -74,7 +84,7 @@ Usage Examples:
     python pt5_s3_tool.py
 
 System Requirements:
-    - Python 3.6 or higher
+    - Python 3.8 or higher (required by the pinned boto3 and s3transfer)
     - Sufficient system resources for concurrent processing
     - Recommended: 4+ CPU cores and 8GB+ RAM for large file sets
 
@@ -82,54 +92,248 @@ Author: robertdcurrier@tamu.edu
 """
 
 import argparse
+import asyncio
+import fnmatch
+import functools
+import hashlib
 import logging
+import multiprocessing
 import os
+import queue
+import re
 import sys
+import threading
 import time
-from typing import Optional, List, Tuple, Dict
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from itertools import chain, islice
+from typing import (
+    AsyncIterator, Callable, Optional, List, Tuple, Iterable, Iterator,
+    Pattern
+)
+from concurrent.futures import (
+    ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait,
+    FIRST_COMPLETED
+)
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 from botocore.config import Config
+from s3transfer.processpool import (
+    ProcessPoolDownloader, ProcessTransferConfig
+)
 from colorama import Fore, Style, init
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+try:
+    import aioboto3  # Optional, enables --async transfers
+except ImportError:
+    aioboto3 = None
+
+try:
+    from s3transfer.crt import (  # Optional, enables --crt transfers
+        BotocoreCRTCredentialsWrapper,
+        BotocoreCRTRequestSerializer,
+        CRTTransferManager,
+        create_s3_crt_client
+    )
+    import botocore.session
+except ImportError:
+    CRTTransferManager = None
+
 # Load environment variables from .env file
 load_dotenv()
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+class ColorFormatter(logging.Formatter):
+    """Color whole log lines by level so call sites need no ANSI codes."""
+    
+    LEVEL_COLORS = {
+        logging.DEBUG: Fore.CYAN,
+        logging.INFO: Fore.GREEN,
+        logging.WARNING: Fore.YELLOW,
+        logging.ERROR: Fore.RED,
+        logging.CRITICAL: Fore.RED
+    }
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record and wrap it in its level's color."""
+        message = super().format(record)
+        color = self.LEVEL_COLORS.get(record.levelno)
+        return f"{color}{message}{Style.RESET_ALL}" if color else message
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(ColorFormatter(
+    fmt='%(asctime)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
 # Suppress boto3's INFO messages about finding credentials
 logging.getLogger('boto3.credentials').setLevel(logging.WARNING)
 logging.getLogger('botocore.credentials').setLevel(logging.WARNING)
 
-def validate_aws_credentials() -> bool:
-    """Validate AWS credentials by making a simple API call."""
+# Shared S3 client settings, see configure_s3_client()
+_S3_CONFIG = Config(
+    # Adaptive mode adds client-side rate limiting on top of standard
+    # retries, backing off instead of thrashing on 503 SlowDown
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=5,  # Connection timeout in seconds
+    read_timeout=60,    # Read timeout in seconds
+    tcp_keepalive=True,  # Enable TCP keepalive
+    s3={
+        # Send UNSIGNED-PAYLOAD instead of hashing every uploaded byte;
+        # botocore only honours this over HTTPS
+        'payload_signing_enabled': False,
+        'use_accelerate_endpoint': False
+    }
+)
+
+# Objects at or above this size are split into ranged GETs and downloaded
+# by a process pool instead of the per-file thread pool
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+# Read size for streaming small downloads to disk. Most IFCB files fit in
+# one chunk, and at most one chunk per worker is held in memory
+DOWNLOAD_CHUNKSIZE = 256 * 1024
+
+# Multipart settings for per-file uploads: parts above the threshold are
+# sent concurrently by s3transfer
+_TX_CFG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_CHUNKSIZE,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Default number of concurrent thread-pool transfers. S3 transfers spend
+# most of their time waiting on the network, and S3 accepts 3,500
+# PUT/COPY/POST/DELETE and 5,500 GET requests per second per prefix, so
+# well over 100 workers is typically safe
+DEFAULT_MAX_WORKERS = 128
+
+# Size classes for choose_max_workers(). Small objects are latency bound
+# and keep scaling with more workers; objects over 1 MB are bandwidth
+# bound and gain little past a couple of dozen concurrent transfers
+SMALL_OBJECT_SIZE = 100 * 1024
+LARGE_OBJECT_SIZE = 1024 * 1024
+LARGE_OBJECT_MAX_WORKERS = 24
+# Floor for the in-between class so small hosts stay network bound
+MEDIUM_OBJECT_MIN_WORKERS = 32
+
+# Number of concurrent DeleteObjects requests, each removing up to 1000 keys
+DELETE_MAX_WORKERS = 16
+
+# Default number of in-flight S3 requests for --async transfers; an
+# explicit --max-workers overrides it
+ASYNC_MAX_INFLIGHT = 256
+
+# Targets already validated in this process (a bucket name, or None for
+# the STS identity check), so embedding callers only pay for it once
+_validated_credentials = set()
+
+def check_bucket_access(
+    session: boto3.Session,
+    s3_client: boto3.client,
+    bucket: str
+) -> None:
+    """
+    Check access to a bucket with HeadBucket.
+    
+    HEAD responses carry no error body, so bad credentials only show up
+    as a bare 400 or 403. In that case STS GetCallerIdentity is called
+    to tell them apart from a bucket permission problem. Only an STS
+    InvalidClientTokenId or ExpiredToken error is raised in its place;
+    any other outcome, including an unreachable STS endpoint, re-raises
+    the original HeadBucket error.
+    """
+    try:
+        s3_client.head_bucket(Bucket=bucket)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code', '') in ('400', '403'):
+            try:
+                session.client('sts').get_caller_identity()
+            except ClientError as sts_error:
+                code = sts_error.response.get('Error', {}).get('Code', '')
+                if (code == 'InvalidClientTokenId' or
+                        code.startswith('ExpiredToken')):
+                    raise
+            except Exception:
+                pass  # No usable STS endpoint, so report the S3 error
+        raise
+
+def credential_error_message(code: str, bucket: Optional[str]) -> str:
+    """Return a readable explanation for a validation error code."""
+    if code in ('InvalidClientTokenId', 'InvalidAccessKeyId'):
+        return "the access key ID is not valid"
+    if code in ('ExpiredToken', 'ExpiredTokenException'):
+        return "the session token has expired, refresh credentials"
+    if code in ('403', 'AccessDenied'):
+        return f"access denied to bucket {bucket}"
+    if code in ('404', 'NoSuchBucket'):
+        return f"bucket {bucket} does not exist"
+    return ''
+
+def validate_aws_credentials(
+    bucket: Optional[str] = None,
+    s3_client: Optional[boto3.client] = None
+) -> bool:
+    """
+    Validate AWS credentials with a small, fixed-size API call.
+    
+    Uses HeadBucket when the target bucket is known, which also confirms
+    access to it, and STS GetCallerIdentity otherwise. Successful checks
+    are cached for the life of the process.
+    
+    Args:
+        bucket: Optional S3 bucket to check access to
+        s3_client: Optional S3 client to validate with; passing the shared
+            client warms its connection pool for the operation that follows
+        
+    Returns:
+        bool: True if credentials are valid, False otherwise
+    """
+    if bucket in _validated_credentials:
+        return True
     try:
         session = boto3.Session()
-        s3 = session.client('s3')
-        s3.list_buckets()
-        logger.info(f"{Fore.GREEN}AWS credentials validated{Style.RESET_ALL}")
+        if bucket:
+            check_bucket_access(
+                session, s3_client or session.client('s3'), bucket
+            )
+        else:
+            session.client('sts').get_caller_identity()
+        logger.info("AWS credentials validated")
+        _validated_credentials.add(bucket)
         return True
+    except NoCredentialsError:
+        logger.error("Error: No AWS credentials found")
+        return False
+    except ClientError as e:
+        code = e.response.get('Error', {}).get('Code', '')
+        message = credential_error_message(code, bucket) or str(e)
+        logger.error(f"Error: AWS credentials validation failed: {message}")
+        return False
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error: AWS credentials validation failed: "
-            f"{str(e)}{Style.RESET_ALL}"
-        )
+        logger.error(f"Error: AWS credentials validation failed: {str(e)}")
         return False
 
+def split_s3_url(url: str) -> Tuple[str, str]:
+    """
+    Split an s3://bucket/prefix URL into bucket and prefix.
+    
+    A single str.partition does the split without building a list, and
+    a missing prefix comes back as an empty string.
+    """
+    rest = url[5:] if url.startswith('s3://') else url
+    bucket, _, prefix = rest.partition('/')
+    return bucket, prefix
+
 def get_default_source() -> Optional[str]:
     """Get the default source directory from environment variables."""
     ifcb_dir = os.getenv('IFCB_DATA_DIR')
@@ -142,8 +346,7 @@ def get_default_bucket() -> Optional[str]:
     upload_url = os.getenv('AWS_UPLOAD_URL', '')
     if upload_url.startswith('s3://'):
         # Extract bucket from s3://bucket/path format
-        parts = upload_url[5:].split('/')
-        return parts[0]
+        return split_s3_url(upload_url)[0]
     return None
 
 def get_default_prefix() -> str:
@@ -151,9 +354,7 @@ def get_default_prefix() -> str:
     upload_url = os.getenv('AWS_UPLOAD_URL', '')
     if upload_url.startswith('s3://'):
         # Extract path after bucket
-        parts = upload_url[5:].split('/')
-        if len(parts) > 1:
-            return '/'.join(parts[1:])
+        return split_s3_url(upload_url)[1]
     return ''
 
 def setup_argparse() -> argparse.ArgumentParser:
@@ -213,11 +414,48 @@ def setup_argparse() -> argparse.ArgumentParser:
         action='store_true',
         help='Overwrite existing files when downloading'
     )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Verify downloaded files against their S3 ETag (MD5)'
+    )
+    parser.add_argument(
+        '--no-multiprocess',
+        dest='no_multiprocess',
+        action='store_true',
+        help='Run --verify checks in this process instead of a process pool'
+    )
     parser.add_argument(
         '--filter',
         help='Filter pattern for files to process (e.g., "*.png")'
     )
     
+    # Transfer options
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Use asyncio/aioboto3 for transfers (requires aioboto3)'
+    )
+    parser.add_argument(
+        '--crt',
+        dest='use_crt',
+        action='store_true',
+        help='Use the AWS CRT client for large downloads (requires awscrt)'
+    )
+    
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        help='Maximum concurrent transfers (default: chosen from the median '
+             f'object size, up to {DEFAULT_MAX_WORKERS})'
+    )
+    parser.add_argument(
+        '--max-connections',
+        type=int,
+        help='S3 connection pool size (default: max(100, 2 x workers))'
+    )
+    
     # Delete option
     parser.add_argument(
         '--delete',
@@ -231,76 +469,97 @@ def validate_args(args: argparse.Namespace) -> bool:
     """Validate command line arguments based on operation mode."""
     # Parse source if it's in s3:// format
     if args.source and args.source.startswith('s3://'):
-        # Extract bucket and prefix from s3://bucket/prefix format
-        s3_path = args.source[5:]  # Remove 's3://'
-        parts = s3_path.split('/', 1)  # Split at first '/'
-        
         # Set bucket and prefix from source
-        args.bucket = parts[0]
-        args.prefix = parts[1] if len(parts) > 1 else ''
+        args.bucket, args.prefix = split_s3_url(args.source)
         
         logger.info(
-            f"{Fore.CYAN}Using source: {args.source} "
-            f"(bucket: {args.bucket}, prefix: {args.prefix}){Style.RESET_ALL}"
+            f"Using source: {args.source} "
+            f"(bucket: {args.bucket}, prefix: {args.prefix})"
         )
     # Parse destination if it's in s3:// format
     elif args.destination and args.destination.startswith('s3://'):
-        # Extract bucket and prefix from s3://bucket/prefix format
-        s3_path = args.destination[5:]  # Remove 's3://'
-        parts = s3_path.split('/', 1)  # Split at first '/'
-        
         # Set bucket and prefix from destination
-        args.bucket = parts[0]
-        args.prefix = parts[1] if len(parts) > 1 else ''
+        args.bucket, args.prefix = split_s3_url(args.destination)
         
         logger.info(
-            f"{Fore.CYAN}Using destination: {args.destination} "
-            f"(bucket: {args.bucket}, prefix: {args.prefix}){Style.RESET_ALL}"
+            f"Using destination: {args.destination} "
+            f"(bucket: {args.bucket}, prefix: {args.prefix})"
         )
     else:
         logger.error(
-            f"{Fore.RED}Error: Either source or destination must be an S3 URL "
-            f"(s3://bucket/prefix){Style.RESET_ALL}"
+            "Error: Either source or destination must be an S3 URL "
+            "(s3://bucket/prefix)"
         )
         return False
         
+    if args.max_workers is not None and args.max_workers < 1:
+        logger.error("Error: --max-workers must be at least 1")
+        return False
+    if args.max_connections is not None and args.max_connections < 1:
+        logger.error("Error: --max-connections must be at least 1")
+        return False
+        
     # Common validation for all operations
     if not args.bucket:
         logger.error(
-            f"{Fore.RED}Error: S3 bucket not specified. "
-            f"Use s3://bucket/prefix format for S3 locations{Style.RESET_ALL}"
+            "Error: S3 bucket not specified. "
+            "Use s3://bucket/prefix format for S3 locations"
         )
         return False
         
     # Validate local paths
     if args.source and not args.source.startswith('s3://'):
         if not os.path.exists(args.source):
-            logger.error(
-                f"{Fore.RED}Error: Source path does not exist: "
-                f"{args.source}{Style.RESET_ALL}"
-            )
+            logger.error(f"Error: Source path does not exist: {args.source}")
             return False
             
     if args.destination and not args.destination.startswith('s3://'):
         try:
             os.makedirs(args.destination, exist_ok=True)
-            logger.info(
-                f"{Fore.CYAN}Created destination directory: "
-                f"{args.destination}{Style.RESET_ALL}"
-            )
+            logger.info(f"Created destination directory: {args.destination}")
         except Exception as e:
             logger.error(
-                f"{Fore.RED}Error creating destination directory: "
-                f"{args.destination} - {str(e)}{Style.RESET_ALL}"
+                "Error creating destination directory: "
+                f"{args.destination} - {str(e)}"
             )
             return False
     
     return True
 
+def walk_files(
+    root: str,
+    recursive: bool,
+    rel_dir: str = ''
+) -> Iterator[Tuple[str, str, int]]:
+    """
+    Yield (local_path, relative_path, size) for files below root.
+    
+    Uses os.scandir, so the file type comes from the directory entry
+    without an extra stat() call and there is no separate getsize() or
+    isfile() per file. On POSIX, DirEntry.stat() still makes one stat
+    call for the size. Symlinked files are uploaded with their target's
+    contents, while symlinked directories are not descended into, so a
+    link cannot send the walk into a loop.
+    
+    Args:
+        root: Directory to scan
+        recursive: Whether to descend into subdirectories
+        rel_dir: Relative path of root from the top-level source
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            rel_path = rel_dir + entry.name
+            if entry.is_file():
+                yield entry.path, rel_path, entry.stat().st_size
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                yield from walk_files(
+                    entry.path, recursive, rel_path + os.sep
+                )
+
 def get_files_to_upload(
     source: str, 
     recursive: bool = False
-) -> List[Tuple[str, str]]:
+) -> List[Tuple[str, str, int]]:
     """
     Get list of files to upload and their S3 keys.
     
@@ -309,28 +568,20 @@ def get_files_to_upload(
         recursive: Whether to include subdirectories
         
     Returns:
-        List of tuples containing (local_path, s3_key)
+        List of tuples containing (local_path, s3_key, size)
     """
-    source_path = Path(source)
-    if not source_path.exists():
+    if not os.path.exists(source):
         raise FileNotFoundError(f"Source path does not exist: {source}")
         
-    if source_path.is_file():
-        return [(str(source_path), source_path.name)]
-    else:
-        files = []
-        pattern = "**/*" if recursive else "*"
-        
-        for file_path in source_path.glob(pattern):
-            if file_path.is_file():
-                # Get relative path for S3 key
-                rel_path = file_path.relative_to(source_path)
-                files.append((str(file_path), str(rel_path)))
-            
-        return files
+    if os.path.isfile(source):
+        return [
+            (source, os.path.basename(source), os.path.getsize(source))
+        ]
+    return list(walk_files(source, recursive))
 
 def upload_file(s3_client: boto3.client, local_path: str, bucket: str, 
-                s3_key: str, dry_run: bool = False) -> bool:
+                s3_key: str, dry_run: bool = False,
+                callback: Optional[Callable[[int], None]] = None) -> bool:
     """
     Upload a single file to S3.
     
@@ -340,31 +591,46 @@ def upload_file(s3_client: boto3.client, local_path: str, bucket: str,
         bucket: S3 bucket name
         s3_key: S3 key (path in bucket)
         dry_run: Whether to simulate upload
+        callback: Optional function called with bytes transferred
         
     Returns:
         bool: True if upload successful, False otherwise
     """
     try:
         if dry_run:
-            logger.info(f"{Fore.CYAN}Would upload: {local_path} -> "
-                       f"s3://{bucket}/{s3_key}{Style.RESET_ALL}")
+            logger.info(f"Would upload: {local_path} -> "
+                       f"s3://{bucket}/{s3_key}")
             return True
             
-        logger.debug(
-            f"{Fore.CYAN}Starting upload of {local_path}{Style.RESET_ALL}"
-        )
-        with open(local_path, 'rb') as f:
-            s3_client.upload_fileobj(f, bucket, s3_key)
-        logger.debug(
-            f"{Fore.GREEN}Completed upload of {local_path}{Style.RESET_ALL}"
+        logger.debug("Starting upload of %s", local_path)
+        s3_client.upload_file(
+            local_path, bucket, s3_key, Config=_TX_CFG, Callback=callback
         )
+        logger.debug("Completed upload of %s", local_path)
         return True
         
     except Exception as e:
-        logger.error(f"{Fore.RED}Error uploading {local_path}: {str(e)}"
-                    f"{Style.RESET_ALL}")
+        logger.error(f"Error uploading {local_path}: {str(e)}")
         return False
 
+def progress_bar(total: Optional[int] = None, **kwargs) -> tqdm:
+    """
+    Create a tqdm progress bar that redraws at most five times a second.
+    
+    With a known total, miniters also caps redraws at about 200 for the
+    whole run. The bar is disabled when stderr is not a terminal, so log
+    files and CI output skip rendering entirely.
+    """
+    if total:
+        kwargs.setdefault('miniters', max(1, total // 200))
+    return tqdm(
+        total=total,
+        mininterval=0.2,
+        smoothing=0.1,
+        disable=not sys.stderr.isatty(),
+        **kwargs
+    )
+
 def format_size(size_bytes: int) -> str:
     """Format size in bytes to human readable string."""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -393,129 +659,392 @@ def print_summary_report(
     avg_rate = total_size / duration if duration > 0 else 0
     files_per_second = total_files / duration if duration > 0 else 0
     
+    logger.info(f"\n{operation.capitalize()} Summary Report:")
+    logger.info(f"Total Files: {total_files}")
+    logger.info(f"Total Size: {format_size(total_size)}")
+    logger.info(f"Duration: {duration:.2f} seconds")
+    logger.info(f"Average Rate: {format_size(avg_rate)}/s")
+    logger.info(f"Files/Second: {files_per_second:.2f}")
+
+def get_pool_size(args: argparse.Namespace, max_workers: int) -> int:
+    """Return the S3 connection pool size for the given worker count."""
+    if args.max_connections is not None:
+        return args.max_connections
+    # Keep at least two connections per worker so none wait on the pool
+    return max(100, max_workers * 2)
+
+@functools.lru_cache(maxsize=1)
+def configure_s3_client(max_pool_connections: int = 100) -> boto3.client:
+    """
+    Configure and return an S3 client with optimized settings.
+    
+    The client is cached so every caller shares one session and one warm
+    connection pool. boto3 clients are thread-safe for making requests.
+    """
     logger.info(
-        f"\n{Fore.GREEN}{operation.capitalize()} Summary "
-        f"Report:{Style.RESET_ALL}"
-    )
-    logger.info(f"{Fore.CYAN}Total Files:{Style.RESET_ALL} {total_files}")
-    logger.info(
-        f"{Fore.CYAN}Total Size:{Style.RESET_ALL} {format_size(total_size)}"
-    )
-    logger.info(
-        f"{Fore.CYAN}Duration:{Style.RESET_ALL} {duration:.2f} seconds"
-    )
-    logger.info(
-        f"{Fore.CYAN}Average Rate:{Style.RESET_ALL} {format_size(avg_rate)}/s"
+        f"Using S3 connection pool of {max_pool_connections} "
+        "connections"
     )
-    logger.info(
-        f"{Fore.CYAN}Files/Second:{Style.RESET_ALL} {files_per_second:.2f}"
+    config = _S3_CONFIG.merge(
+        Config(max_pool_connections=max_pool_connections)
     )
+    return boto3.Session().client('s3', config=config)
 
-def configure_s3_client() -> boto3.client:
-    """Configure and return an S3 client with optimized settings."""
-    session = boto3.Session()
-    config = Config(
-        max_pool_connections=100,  # Increase connection pool size
-        retries={'max_attempts': 3},  # Add retry configuration
-        connect_timeout=5,  # Connection timeout in seconds
-        read_timeout=60,    # Read timeout in seconds
-        tcp_keepalive=True  # Enable TCP keepalive
-    )
-    return session.client('s3', config=config)
+def get_s3_client(args: argparse.Namespace) -> boto3.client:
+    """Return the shared S3 client sized for the configured workers."""
+    max_workers = args.max_workers or DEFAULT_MAX_WORKERS
+    return configure_s3_client(get_pool_size(args, max_workers))
+
+@functools.lru_cache(maxsize=1)
+def configure_delete_client() -> boto3.client:
+    """
+    Return a client dedicated to DeleteObjects calls.
+    
+    Client-side parameter validation walks every key of a 1000-key
+    request and costs about a fifth of botocore's CPU time per call, so
+    it is disabled here; S3 still validates the request server-side.
+    Keys come straight from a listing, so they are always well formed.
+    """
+    config = _S3_CONFIG.merge(Config(
+        max_pool_connections=DELETE_MAX_WORKERS,
+        parameter_validation=False
+    ))
+    return boto3.Session().client('s3', config=config)
+
+def choose_max_workers(
+    args: argparse.Namespace,
+    sizes: List[int],
+    total_files: Optional[int] = None
+) -> Tuple[int, str]:
+    """
+    Choose the thread pool size for a set of transfers.
+    
+    An explicit --max-workers is used as given. Otherwise the count
+    follows the median object size: below SMALL_OBJECT_SIZE it is
+    DEFAULT_MAX_WORKERS, above LARGE_OBJECT_SIZE it is
+    LARGE_OBJECT_MAX_WORKERS, and in between four workers per core but
+    never fewer than MEDIUM_OBJECT_MIN_WORKERS.
+    The result never exceeds the connection pool or total_files, when
+    the number of transfers is known.
+    
+    Args:
+        args: Parsed command line arguments
+        sizes: Sizes of the objects, or a sample of them
+        total_files: Number of transfers, or None if not yet known
+        
+    Returns:
+        Tuple of worker count and a short rationale for logging
+    """
+    if args.max_workers:
+        max_workers = args.max_workers
+        reason = "set by --max-workers"
+    else:
+        median = sorted(sizes)[len(sizes) // 2] if sizes else 0
+        if median < SMALL_OBJECT_SIZE:
+            max_workers = DEFAULT_MAX_WORKERS
+        elif median > LARGE_OBJECT_SIZE:
+            max_workers = LARGE_OBJECT_MAX_WORKERS
+        else:
+            per_core = (os.cpu_count() or 1) * 4
+            max_workers = min(
+                DEFAULT_MAX_WORKERS,
+                max(MEDIUM_OBJECT_MIN_WORKERS, per_core)
+            )
+        reason = f"median object size {format_size(median)}"
+    
+    # More workers than pooled connections would only churn connections
+    pool_size = get_pool_size(args, args.max_workers or DEFAULT_MAX_WORKERS)
+    if max_workers > pool_size:
+        max_workers = pool_size
+        reason += f", capped by the {pool_size} connection pool"
+    if total_files is not None:
+        max_workers = max(1, min(max_workers, total_files))
+    return max_workers, reason
 
 def prepare_upload_tasks(
-    files: List[Tuple[str, str]], 
+    files: List[Tuple[str, str, int]], 
     prefix: str
-) -> List[Tuple[str, str]]:
+) -> List[Tuple[str, str, int]]:
     """Prepare upload tasks by combining prefix with S3 keys."""
-    upload_tasks = []
-    for local_path, s3_key in files:
-        full_s3_key = os.path.join(prefix, s3_key).replace('\\', '/')
-        upload_tasks.append((local_path, full_s3_key))
-    return upload_tasks
+    prefix_clean = prefix.rstrip('/') + '/' if prefix else ''
+    # Relative paths only need separator rewriting on Windows
+    if os.sep == '\\':
+        return [
+            (local_path, prefix_clean + s3_key.replace('\\', '/'), size)
+            for local_path, s3_key, size in files
+        ]
+    return [
+        (local_path, prefix_clean + s3_key, size)
+        for local_path, s3_key, size in files
+    ]
 
 def process_dry_run_upload(
-    files: List[Tuple[str, str]], 
+    files: List[Tuple[str, str, int]], 
     args: argparse.Namespace
 ) -> bool:
     """Process dry run for upload operation."""
-    total_size = sum(os.path.getsize(local_path) for local_path, _ in files)
+    total_size = sum(size for _, _, size in files)
     logger.info(
-        f"{Fore.CYAN}Dry run - would upload {len(files)} files "
+        f"Dry run - would upload {len(files)} files "
         f"({format_size(total_size)}) from {args.source} "
-        f"to s3://{args.bucket}/{args.prefix}{Style.RESET_ALL}"
+        f"to s3://{args.bucket}/{args.prefix}"
     )
     return True
 
-def submit_upload_tasks(
+def bounded_map(
     executor: ThreadPoolExecutor,
-    upload_tasks: List[Tuple[str, str]],
-    s3_client: boto3.client,
-    args: argparse.Namespace,
-    total_files: int
-) -> Dict[Future, str]:
-    """Submit upload tasks to the executor and return futures mapping."""
-    future_to_file = {}
-    
-    # Show progress during file submission
-    with tqdm(
-        total=total_files, 
-        desc="Submitting files", 
-        unit="file"
-    ) as submit_pbar:
-        # Submit files in batches of 1000
-        batch_size = 1000
-        for i in range(0, len(upload_tasks), batch_size):
-            batch = upload_tasks[i:i + batch_size]
-            # Submit batch of files
-            futures = [
-                executor.submit(
-                    upload_file, s3_client, local_path, args.bucket,
-                    s3_key, args.dry_run
-                ) for local_path, s3_key in batch
-            ]
-            # Map futures to file paths
-            for future, (local_path, _) in zip(futures, batch):
-                future_to_file[future] = local_path
-            submit_pbar.update(len(batch))
-    
-    return future_to_file
-
-def process_upload_results(
-    future_to_file: Dict[Future, str],
-    total_files: int
-) -> Tuple[bool, int]:
-    """Process upload results and return success status and total size."""
+    fn: Callable,
+    tasks: Iterable,
+    max_pending: int
+) -> Iterator:
+    """
+    Map fn over tasks on the executor, yielding results as they complete.
+    
+    Unlike executor.map, tasks are consumed lazily and at most max_pending
+    futures exist at once, so memory stays bounded for any number of
+    tasks and the task iterable may be a stream.
+    """
+    pending = set()
+    for task in tasks:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(executor.submit(fn, task))
+    for future in as_completed(pending):
+        yield future.result()
+
+def prefetch(items: Iterable, maxsize: int) -> Iterator:
+    """
+    Yield items produced on a background thread through a bounded queue.
+    
+    The producer runs up to maxsize items ahead of the consumer, so a
+    slow ListObjectsV2 page never stalls submission of work that is
+    already listed. Exceptions raised while producing are re-raised in
+    the consumer.
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    done = object()
+    error = []
+    
+    def _produce() -> None:
+        """Fill the buffer from items, then post the done sentinel."""
+        try:
+            for item in items:
+                buffer.put(item)
+        except Exception as e:
+            error.append(e)
+        finally:
+            buffer.put(done)
+    
+    threading.Thread(target=_produce, daemon=True).start()
+    while True:
+        item = buffer.get()
+        if item is done:
+            break
+        yield item
+    if error:
+        raise error[0]
+
+async def iter_in_thread(items: Iterable, maxsize: int = 64) -> AsyncIterator:
+    """
+    Yield items from a blocking iterable without blocking the event loop.
+    
+    The iterable runs ahead on a producer thread through prefetch(), and
+    each item is awaited from the default executor, so listing calls,
+    scandir/makedirs and process pool start-up never stall in-flight
+    requests.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = prefetch(items, maxsize)
+    done = object()
+    while True:
+        item = await loop.run_in_executor(None, next, iterator, done)
+        if item is done:
+            return
+        yield item
+
+def async_available(args: argparse.Namespace) -> bool:
+    """Return True if --async was requested and aioboto3 is installed."""
+    if not args.use_async:
+        return False
+    if aioboto3 is None:
+        logger.warning(
+            "aioboto3 is not installed, falling back to "
+            "threaded transfers"
+        )
+        return False
+    return True
+
+def crt_available(args: argparse.Namespace) -> bool:
+    """Return True if --crt was requested and awscrt is installed."""
+    if not args.use_crt:
+        return False
+    if CRTTransferManager is None:
+        logger.warning(
+            "awscrt is not installed, falling back to "
+            "process pool downloads"
+        )
+        return False
+    return True
+
+async def run_async_task(
+    s3_client,
+    transfer_one: Callable,
+    task: tuple,
+    semaphore: asyncio.Semaphore,
+    stats: dict,
+    pbar: tqdm
+) -> None:
+    """
+    Run one transfer for run_async_transfers() and record the outcome.
+    
+    The semaphore slot is released as soon as the transfer finishes, so
+    the next task can start before the bookkeeping is done.
+    """
+    try:
+        ok = await transfer_one(s3_client, task)
+    finally:
+        semaphore.release()
+    stats['files'] += 1
+    if ok:
+        stats['size'] += task[-1]
+    else:
+        stats['success'] = False
+    pbar.update(1)
+
+async def run_async_transfers(
+    tasks: Iterable[tuple],
+    transfer_one: Callable,
+    desc: str,
+    total: Optional[int] = None,
+    max_inflight: int = ASYNC_MAX_INFLIGHT
+) -> Tuple[bool, int, int]:
+    """
+    Run transfers concurrently on a single aioboto3 client.
+    
+    Tasks are consumed lazily on a producer thread with at most
+    max_inflight pending, so the task iterable may be a streaming
+    listing whose blocking calls stay off the event loop. transfer_one
+    is a coroutine function taking (s3_client, task) that returns True
+    on success; each task ends with the file size. The client's
+    connection pool is sized to match, so no transfer waits on it.
+    Returns a tuple of success status, files processed and total size.
+    """
+    session = aioboto3.Session()
+    semaphore = asyncio.Semaphore(max_inflight)
+    config = _S3_CONFIG.merge(Config(max_pool_connections=max_inflight))
+    stats = {'success': True, 'files': 0, 'size': 0}
+    
+    async with session.client('s3', config=config) as s3:
+        with progress_bar(total=total, desc=desc, unit="file") as pbar:
+            pending = set()
+            async for task in iter_in_thread(tasks):
+                await semaphore.acquire()
+                future = asyncio.ensure_future(run_async_task(
+                    s3, transfer_one, task, semaphore, stats, pbar
+                ))
+                pending.add(future)
+                future.add_done_callback(pending.discard)
+            await asyncio.gather(*pending)
+    return stats['success'], stats['files'], stats['size']
+
+async def upload_file_async(
+    s3_client,
+    task: Tuple[str, str, int],
+    bucket: str
+) -> bool:
+    """Upload a single file to S3 with an aioboto3 client."""
+    local_path, s3_key, _ = task
+    try:
+        await s3_client.upload_file(
+            local_path, bucket, s3_key, Config=_TX_CFG
+        )
+        logger.debug("Completed upload of %s", local_path)
+        return True
+    except Exception as e:
+        logger.error(f"Error uploading {local_path}: {str(e)}")
+        return False
+
+def start_thread_pool(max_workers: int, reason: str) -> ThreadPoolExecutor:
+    """Log the chosen worker count and return a pool of that size."""
+    logger.info(
+        f"Starting ThreadPoolExecutor with {max_workers} "
+        f"workers ({reason})"
+    )
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+def tally_transfers(
+    results: Iterable[Tuple[bool, int]],
+    pbar: Optional[tqdm] = None
+) -> Tuple[bool, int, int]:
+    """
+    Sum (ok, size) transfer results as bounded_map() yields them.
+    
+    Only successful transfers count towards the total size. When pbar is
+    given it advances one file per result; only the calling thread
+    touches it, so no lock is needed.
+    
+    Returns:
+        Tuple of success status, files processed and total size
+    """
     success = True
+    total_files = 0
     total_size = 0
+    for ok, size in results:
+        if ok:
+            total_size += size
+        else:
+            success = False
+        total_files += 1
+        if pbar is not None:
+            pbar.update(1)
+    return success, total_files, total_size
+
+def locked_update(pbar: tqdm) -> Callable[[int], None]:
+    """Return a thread-safe callback that advances pbar by a byte count."""
+    lock = threading.Lock()
     
-    # Create progress bar for upload completion
-    with tqdm(
-        total=total_files, 
-        desc="Uploading files", 
-        unit="file"
-    ) as pbar:
-        for future in as_completed(future_to_file):
-            file_path = future_to_file[future]
-            try:
-                if not future.result():
-                    success = False
-                # Add file size to total
-                file_size = os.path.getsize(file_path)
-                total_size += file_size
-                pbar.update(1)  # Update progress after each file
-                logger.debug(
-                    f"{Fore.GREEN}Successfully uploaded {file_path}"
-                    f"{Style.RESET_ALL}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"{Fore.RED}Error uploading {file_path}: {str(e)}"
-                    f"{Style.RESET_ALL}"
-                )
-                success = False
-                pbar.update(1)  # Update progress even on error
+    def _progress(bytes_transferred: int) -> None:
+        """Advance the bar from an s3transfer worker thread."""
+        with lock:
+            pbar.update(bytes_transferred)
+    
+    return _progress
+
+def upload_files_threaded(
+    upload_tasks: List[Tuple[str, str, int]],
+    s3_client: boto3.client,
+    args: argparse.Namespace
+) -> Tuple[bool, int]:
+    """
+    Upload files concurrently using a thread pool.
+    
+    Progress is reported in bytes from s3transfer's callback, so large
+    files advance the bar while they are still uploading.
+    """
+    max_workers, reason = choose_max_workers(
+        args, [size for _, _, size in upload_tasks], len(upload_tasks)
+    )
+    pbar = progress_bar(
+        total=sum(size for _, _, size in upload_tasks),
+        desc="Uploading files", unit="B", unit_scale=True
+    )
+    callback = locked_update(pbar)
+    
+    def _upload_one(task: Tuple[str, str, int]) -> Tuple[bool, int]:
+        """Upload one task, returning whether it succeeded and its size."""
+        local_path, s3_key, size = task
+        ok = upload_file(
+            s3_client, local_path, args.bucket, s3_key, args.dry_run,
+            callback=callback
+        )
+        return ok, size
     
+    with pbar, start_thread_pool(max_workers, reason) as executor:
+        success, _, total_size = tally_transfers(bounded_map(
+            executor, _upload_one, upload_tasks, max_workers * 2
+        ))
     return success, total_size
 
 def upload_files(
@@ -531,16 +1060,14 @@ def upload_files(
         bool: True if all uploads successful, False otherwise
     """
     try:
-        # Configure S3 client
-        s3_client = configure_s3_client()
+        # Get the shared S3 client
+        s3_client = get_s3_client(args)
         
         # Get files to upload
         files = get_files_to_upload(args.source, args.recursive)
         
         if not files:
-            logger.warning(
-                f"{Fore.YELLOW}No files found to upload{Style.RESET_ALL}"
-            )
+            logger.warning("No files found to upload")
             return True
             
         # Handle dry run
@@ -549,41 +1076,29 @@ def upload_files(
             
         # Log initial file count
         total_files = len(files)
-        logger.info(
-            f"{Fore.CYAN}Found {total_files} files to upload{Style.RESET_ALL}"
-        )
+        logger.info(f"Found {total_files} files to upload")
             
-        # Set up concurrent execution
-        max_workers = min(32, total_files)  # Limit to 32 concurrent uploads
-        logger.info(
-            f"{Fore.CYAN}Using {max_workers} concurrent workers"
-            f"{Style.RESET_ALL}"
-        )
-        
         # Initialize statistics and prepare tasks
         start_time = time.time()
         upload_tasks = prepare_upload_tasks(files, args.prefix)
         
-        logger.info(
-            f"{Fore.CYAN}Starting ThreadPoolExecutor with {max_workers} "
-            f"workers{Style.RESET_ALL}"
-        )
-        
         # Execute uploads concurrently
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit tasks
-            future_to_file = submit_upload_tasks(
-                executor, upload_tasks, s3_client, args, total_files
-            )
-            
+        if async_available(args):
+            max_inflight = args.max_workers or ASYNC_MAX_INFLIGHT
             logger.info(
-                f"{Fore.CYAN}All uploads submitted, waiting for completion"
-                f"{Style.RESET_ALL}"
+                f"Using asyncio with up to {max_inflight} "
+                "in-flight uploads"
             )
-            
-            # Process results
-            success, total_size = process_upload_results(
-                future_to_file, total_files
+            success, _, total_size = asyncio.run(run_async_transfers(
+                upload_tasks,
+                functools.partial(upload_file_async, bucket=args.bucket),
+                "Uploading files",
+                total=total_files,
+                max_inflight=max_inflight
+            ))
+        else:
+            success, total_size = upload_files_threaded(
+                upload_tasks, s3_client, args
             )
                         
         # Print summary report
@@ -591,21 +1106,28 @@ def upload_files(
         return success
         
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error during upload process: {str(e)}"
-            f"{Style.RESET_ALL}"
-        )
+        logger.error(f"Error during upload process: {str(e)}")
         return False
 
-def list_s3_objects(
+@functools.lru_cache(maxsize=None)
+def compile_filter(pattern: str) -> Pattern:
+    """
+    Compile a --filter glob into a regex, once per distinct pattern.
+    
+    Matching the compiled regex avoids fnmatch's per-call translation
+    and cache lookup on every listed key.
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+def iter_s3_objects(
     s3_client: boto3.client,
     bucket: str,
     prefix: str,
     recursive: bool = False,
     filter_pattern: str = None
-) -> List[dict]:
+) -> Iterator[dict]:
     """
-    List objects in an S3 bucket with the given prefix.
+    Yield objects in an S3 bucket with the given prefix, page by page.
     
     Args:
         s3_client: Boto3 S3 client
@@ -614,69 +1136,50 @@ def list_s3_objects(
         recursive: Whether to list objects recursively
         filter_pattern: Optional pattern to filter objects
         
-    Returns:
-        List of S3 object dictionaries
+    Yields:
+        S3 object dictionaries
     """
-    try:
-        # If not recursive and prefix doesn't end with '/', add it
-        if not recursive and prefix and not prefix.endswith('/'):
-            prefix = prefix + '/'
-            
-        # List objects in the bucket with the given prefix
-        paginator = s3_client.get_paginator('list_objects_v2')
-        page_iterator = paginator.paginate(
-            Bucket=bucket,
-            Prefix=prefix,
-            Delimiter='' if recursive else '/'
-        )
+    # If not recursive and prefix doesn't end with '/', add it
+    if not recursive and prefix and not prefix.endswith('/'):
+        prefix = prefix + '/'
         
-        objects = []
-        for page in page_iterator:
-            # Add objects
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    # Skip "directory" objects (keys ending with '/')
-                    if obj['Key'].endswith('/'):
-                        continue
-                        
-                    # Apply filter if specified
-                    if filter_pattern:
-                        import fnmatch
-                        filename = os.path.basename(obj['Key'])
-                        if not fnmatch.fnmatch(filename, filter_pattern):
-                            continue
-                            
-                    objects.append(obj)
+    # List objects in the bucket with the given prefix
+    paginator = s3_client.get_paginator('list_objects_v2')
+    page_iterator = paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        Delimiter='' if recursive else '/',
+        PaginationConfig={'PageSize': 1000}  # Maximum allowed by S3 API
+    )
+    
+    filter_re = compile_filter(filter_pattern) if filter_pattern else None
+    
+    for page in page_iterator:
+        # Yield objects
+        for obj in page.get('Contents', []):
+            # Skip "directory" objects (keys ending with '/')
+            if obj['Key'].endswith('/'):
+                continue
+                
+            # Apply filter if specified
+            if filter_re and not filter_re.match(
+                obj['Key'].rpartition('/')[2]
+            ):
+                continue
                     
-            # Add common prefixes (directories) if not recursive
-            if not recursive and 'CommonPrefixes' in page:
-                for prefix_obj in page['CommonPrefixes']:
-                    logger.debug(
-                        f"{Fore.CYAN}Found directory: "
-                        f"{prefix_obj['Prefix']}{Style.RESET_ALL}"
-                    )
-        
-        return objects
-        
-    except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error listing objects in bucket {bucket}: "
-            f"{str(e)}{Style.RESET_ALL}"
-        )
-        return []
+            yield obj
+            
+        # Log common prefixes (directories) if not recursive
+        if not recursive and 'CommonPrefixes' in page:
+            for prefix_obj in page['CommonPrefixes']:
+                logger.debug("Found directory: %s", prefix_obj['Prefix'])
 
 def parse_s3_source(source: str) -> Tuple[str, str]:
     """Parse an S3 URI into bucket and prefix components."""
     if not source.startswith('s3://'):
         return None, None
         
-    # Extract bucket and prefix from s3://bucket/prefix format
-    s3_path = source[5:]  # Remove 's3://'
-    parts = s3_path.split('/', 1)  # Split at first '/'
-    
-    # Set bucket and prefix from source
-    bucket = parts[0]
-    prefix = parts[1] if len(parts) > 1 else ''
+    bucket, prefix = split_s3_url(source)
     
     # Remove trailing slash from prefix if present
     if prefix.endswith('/'):
@@ -684,50 +1187,174 @@ def parse_s3_source(source: str) -> Tuple[str, str]:
     
     return bucket, prefix
 
-def prepare_download_tasks(
-    objects: List[dict], 
-    prefix: str,
-    destination: str
-) -> List[Tuple[str, str, int]]:
-    """Prepare download tasks by mapping S3 keys to local paths."""
-    download_tasks = []
-    for obj in objects:
-        s3_key = obj['Key']
-        # Remove prefix from key to create relative path
-        rel_path = s3_key
-        if prefix and s3_key.startswith(prefix):
-            rel_path = s3_key[len(prefix):]
-            if rel_path.startswith('/'):
-                rel_path = rel_path[1:]
-                
-        local_path = os.path.join(destination, rel_path)
-        download_tasks.append((s3_key, local_path, obj['Size']))
-    return download_tasks
+def list_dir_names(path: str) -> set:
+    """Return the entry names in a directory, or an empty set if absent."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
-def process_dry_run_download(
-    objects: List[dict], 
+def skip_existing(
+    existing_names: dict,
+    local_path: str,
+    rel_dir: str,
+    name: str,
+    stats: Optional[dict] = None
+) -> bool:
+    """
+    Return True if local_path, name in directory rel_dir, already exists.
+    
+    Existing files are found with one scandir per directory, cached in
+    existing_names, instead of a stat per file. Each skip is logged and
+    counted in stats['skipped'] when stats is given.
+    """
+    if rel_dir not in existing_names:
+        existing_names[rel_dir] = list_dir_names(
+            os.path.dirname(local_path)
+        )
+    if name not in existing_names[rel_dir]:
+        return False
+    logger.debug("Skipping existing file: %s", local_path)
+    if stats is not None:
+        stats['skipped'] = stats.get('skipped', 0) + 1
+    return True
+
+def make_parent_dir(
+    created_dirs: set,
+    destination: str,
+    rel_dir: str
+) -> None:
+    """Create rel_dir under destination the first time it is seen."""
+    if rel_dir in created_dirs:
+        return
+    try:
+        os.makedirs(os.path.join(destination, rel_dir), exist_ok=True)
+    except FileExistsError:
+        pass  # A file is in the way; the download reports it
+    created_dirs.add(rel_dir)
+
+def prepare_download_tasks(
+    objects: Iterable[dict], 
+    prefix: str,
+    destination: str,
+    overwrite: bool = False,
+    stats: Optional[dict] = None,
+    etags: Optional[dict] = None
+) -> Iterator[Tuple[str, str, int]]:
+    """
+    Yield download tasks by mapping S3 keys to local paths.
+    
+    This is the single pass between listing and submission: existing
+    files are skipped unless overwrite is set, and the (key, ETag) of
+    each yielded task is recorded in etags, keyed by local path, when
+    etags is given.
+    """
+    # Normalize the prefix once so each key needs a single check and slice;
+    # str.removeprefix would raise the floor from Python 3.8 to 3.9
+    strip = prefix.rstrip('/') + '/' if prefix else ''
+    strip_len = len(strip)
+    created_dirs = set()
+    existing_names = {}
+    for obj in objects:
+        s3_key = obj['Key']
+        # Remove prefix from key to create relative path
+        rel_path = s3_key[strip_len:] if s3_key.startswith(strip) else s3_key
+        local_path = os.path.join(destination, rel_path)
+        rel_dir, _, name = rel_path.rpartition('/')
+        if not overwrite and skip_existing(
+            existing_names, local_path, rel_dir, name, stats
+        ):
+            continue
+        make_parent_dir(created_dirs, destination, rel_dir)
+        if etags is not None:
+            etags[local_path] = (s3_key, obj['ETag'])
+        yield s3_key, local_path, obj['Size']
+
+def process_dry_run_download(
+    objects: Iterable[dict], 
     prefix: str,
     args: argparse.Namespace
 ) -> bool:
-    """Process dry run for download operation."""
-    total_size = sum(obj['Size'] for obj in objects)
+    """Process dry run for download operation in a single pass."""
+    total_files = 0
+    total_size = 0
+    for obj in objects:
+        total_files += 1
+        total_size += obj['Size']
+        
+    if not total_files:
+        logger.warning("No files found to download")
+        return True
+        
     logger.info(
-        f"{Fore.CYAN}Dry run - would download {len(objects)} files "
+        f"Dry run - would download {total_files} files "
         f"({format_size(total_size)}) from s3://{args.bucket}/{args.prefix} "
-        f"to {args.destination}{Style.RESET_ALL}"
+        f"to {args.destination}"
     )
     return True
 
+def remove_partial(temp_path: str) -> None:
+    """Remove a partial download, if it was created at all."""
+    try:
+        os.remove(temp_path)
+    except FileNotFoundError:
+        pass
+
+def write_file(local_path: str, chunks: Iterable[bytes]) -> None:
+    """
+    Stream a downloaded body to local_path.
+    
+    The data goes to a temporary file that is renamed into place, so an
+    interrupted download never leaves a partial file that a later run
+    would skip as already downloaded. The temporary file is removed if
+    the download or write fails.
+    """
+    temp_path = local_path + '.part'
+    try:
+        with open(temp_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_path, local_path)
+    except BaseException:  # Includes KeyboardInterrupt
+        remove_partial(temp_path)
+        raise
+
+async def write_file_async(local_path: str, stream) -> None:
+    """
+    Stream an aiobotocore body to local_path, like write_file().
+    
+    Each file operation runs in the default executor so disk I/O never
+    blocks the event loop and other GETs keep flowing.
+    """
+    loop = asyncio.get_running_loop()
+    temp_path = local_path + '.part'
+    try:
+        f = await loop.run_in_executor(None, open, temp_path, 'wb')
+        try:
+            async for chunk in stream.iter_chunks(DOWNLOAD_CHUNKSIZE):
+                await loop.run_in_executor(None, f.write, chunk)
+        finally:
+            await loop.run_in_executor(None, f.close)
+        await loop.run_in_executor(None, os.replace, temp_path, local_path)
+    except BaseException:  # Includes task cancellation
+        remove_partial(temp_path)
+        raise
+
 def download_file(
     s3_client: boto3.client,
     bucket: str,
     s3_key: str,
     local_path: str,
-    dry_run: bool = False,
-    overwrite: bool = False
+    dry_run: bool = False
 ) -> bool:
     """
-    Download a single file from S3.
+    Download a single small file from S3.
+    
+    Objects routed here are below MULTIPART_THRESHOLD, so the body is
+    fetched with one GetObject and streamed to disk with write_file()
+    in DOWNLOAD_CHUNKSIZE pieces, rather than going through a per-call
+    transfer manager.
     
     Args:
         s3_client: Boto3 S3 client
@@ -735,131 +1362,385 @@ def download_file(
         s3_key: S3 key (path in bucket)
         local_path: Local file path
         dry_run: Whether to simulate download
-        overwrite: Whether to overwrite existing files
         
     Returns:
         bool: True if download successful, False otherwise
     """
     try:
-        if os.path.exists(local_path) and not overwrite:
-            logger.debug(
-                f"{Fore.YELLOW}Skipping existing file: {local_path}"
-                f"{Style.RESET_ALL}"
-            )
-            return True
-            
         if dry_run:
             logger.info(
-                f"{Fore.CYAN}Would download: s3://{bucket}/{s3_key} -> "
-                f"{local_path}{Style.RESET_ALL}"
+                f"Would download: s3://{bucket}/{s3_key} -> "
+                f"{local_path}"
             )
             return True
             
-        # Create directory if it doesn't exist
-        os.makedirs(
-            os.path.dirname(os.path.abspath(local_path)), 
-            exist_ok=True
-        )
-            
-        logger.debug(
-            f"{Fore.CYAN}Starting download of {s3_key}{Style.RESET_ALL}"
-        )
-        s3_client.download_file(bucket, s3_key, local_path)
-        logger.debug(
-            f"{Fore.GREEN}Completed download of {s3_key}{Style.RESET_ALL}"
+        logger.debug("Starting download of %s", s3_key)
+        response = s3_client.get_object(Bucket=bucket, Key=s3_key)
+        write_file(
+            local_path, response['Body'].iter_chunks(DOWNLOAD_CHUNKSIZE)
         )
+        logger.debug("Completed download of %s", s3_key)
         return True
         
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error downloading {s3_key}: {str(e)}"
-            f"{Style.RESET_ALL}"
-        )
+        logger.error(f"Error downloading {s3_key}: {str(e)}")
         return False
 
-def submit_download_tasks(
-    executor: ThreadPoolExecutor,
-    download_tasks: List[Tuple[str, str, int]],
+async def download_file_async(
+    s3_client,
+    task: Tuple[str, str, int],
+    bucket: str
+) -> bool:
+    """
+    Download a single small file from S3 with an aioboto3 client.
+    
+    aioboto3's download_file issues a HeadObject before every GET, which
+    doubles the request count for small objects. Objects routed here are
+    below MULTIPART_THRESHOLD, so a single GetObject is streamed to disk
+    instead.
+    """
+    s3_key, local_path, _ = task
+    try:
+        response = await s3_client.get_object(Bucket=bucket, Key=s3_key)
+        body = response['Body']
+        async with body:  # Releases the connection even on failure
+            await write_file_async(local_path, body)
+        logger.debug("Completed download of %s", s3_key)
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error downloading {s3_key}: {str(e)}")
+        return False
+
+def download_small_files(
+    small_tasks: Iterable[Tuple[str, str, int]],
     s3_client: boto3.client,
-    args: argparse.Namespace,
-    total_files: int
-) -> Dict[Future, Tuple[str, str, int]]:
-    """Submit download tasks to the executor and return futures mapping."""
-    future_to_file = {}
-    
-    # Show progress during file submission
-    with tqdm(
-        total=total_files, 
-        desc="Submitting files", 
-        unit="file"
-    ) as submit_pbar:
-        # Submit files in batches of 1000
-        batch_size = 1000
-        for i in range(0, len(download_tasks), batch_size):
-            batch = download_tasks[i:i + batch_size]
-            # Submit batch of files
-            futures = [
-                executor.submit(
-                    download_file, 
-                    s3_client, 
-                    args.bucket,
-                    s3_key, 
-                    local_path, 
-                    args.dry_run,
-                    args.overwrite
-                ) for s3_key, local_path, size in batch
-            ]
-            # Map futures to file info
-            for future, (s3_key, local_path, size) in zip(
-                futures, batch
-            ):
-                future_to_file[future] = (s3_key, local_path, size)
-            submit_pbar.update(len(batch))
+    args: argparse.Namespace
+) -> Tuple[bool, int, int]:
+    """
+    Download small objects concurrently using a thread pool.
+    
+    Tasks are submitted as they arrive, so listing and downloading
+    overlap. Returns a tuple of success status, files processed and
+    total size.
+    """
+    # Size the pool from the first page of tasks, then chain it back on
+    small_tasks = iter(small_tasks)
+    head = list(islice(small_tasks, 1000))
+    max_workers, reason = choose_max_workers(
+        args, [size for _, _, size in head],
+        len(head) if len(head) < 1000 else None
+    )
+    small_tasks = chain(head, small_tasks)
+    
+    def _download_one(task: Tuple[str, str, int]) -> Tuple[bool, int]:
+        """Download one task, returning whether it succeeded and its size."""
+        s3_key, local_path, size = task
+        ok = download_file(
+            s3_client, args.bucket, s3_key, local_path, args.dry_run
+        )
+        return ok, size
     
-    return future_to_file
+    with progress_bar(
+        desc="Downloading files", unit="file"
+    ) as pbar, start_thread_pool(max_workers, reason) as executor:
+        return tally_transfers(bounded_map(
+            executor, _download_one, small_tasks, max_workers * 2
+        ), pbar)
 
-def process_download_results(
-    future_to_file: Dict[Future, Tuple[str, str, int]],
-    total_files: int
-) -> Tuple[bool, int]:
-    """Process download results and return success status and total size."""
+def submit_large_downloads(
+    download_tasks: Iterable[Tuple[str, str, int]],
+    downloader: ProcessPoolDownloader,
+    large_futures: list,
+    args: argparse.Namespace
+) -> Iterator[Tuple[str, str, int]]:
+    """
+    Submit large objects to the process pool and yield the small ones.
+    
+    Futures for submitted objects are appended to large_futures as
+    (future, s3_key, size) tuples.
+    """
+    for task in download_tasks:
+        s3_key, local_path, size = task
+        if size < MULTIPART_THRESHOLD:
+            yield task
+            continue
+        if isinstance(downloader, ProcessPoolDownloader):
+            # Passing the listed size avoids a HEAD request per object
+            future = downloader.download_file(
+                args.bucket, s3_key, local_path, expected_size=size
+            )
+        else:
+            future = downloader.download(args.bucket, s3_key, local_path)
+        large_futures.append((future, s3_key, size))
+
+def collect_large_downloads(large_futures: list) -> Tuple[bool, int]:
+    """Wait for process pool downloads; return success and total size."""
     success = True
     total_size = 0
-    
-    # Create progress bar for download completion
-    with tqdm(
-        total=total_files, 
-        desc="Downloading files", 
+    with progress_bar(
+        total=len(large_futures),
+        desc="Downloading large files",
         unit="file"
     ) as pbar:
-        for future in as_completed(future_to_file):
-            s3_key, local_path, size = future_to_file[future]
+        for future, s3_key, size in large_futures:
             try:
-                if not future.result():
-                    success = False
-                # Add file size to total
+                future.result()
                 total_size += size
-                pbar.update(1)  # Update progress after each file
-                logger.debug(
-                    f"{Fore.GREEN}Successfully downloaded {s3_key}"
-                    f"{Style.RESET_ALL}"
-                )
+                logger.debug("Successfully downloaded %s", s3_key)
             except Exception as e:
-                logger.error(
-                    f"{Fore.RED}Error downloading {s3_key}: {str(e)}"
-                    f"{Style.RESET_ALL}"
-                )
+                logger.error(f"Error downloading {s3_key}: {str(e)}")
                 success = False
-                pbar.update(1)  # Update progress even on error
-    
+            pbar.update(1)  # Update progress even on error
     return success, total_size
 
+def create_crt_downloader(s3_client: boto3.client):
+    """
+    Create a CRT transfer manager for large downloads.
+    
+    The CRT client splits each object into parallel ranged GETs on its
+    own native event loop, so large objects can approach NIC line rate.
+    Requests are serialized with the endpoint and region of the shared
+    client, which is kept for listing and deletes.
+    """
+    region = s3_client.meta.region_name
+    endpoint_url = s3_client.meta.endpoint_url
+    credentials = boto3.Session().get_credentials()
+    crt_client = create_s3_crt_client(
+        region,
+        crt_credentials_provider=BotocoreCRTCredentialsWrapper(
+            credentials
+        ).to_crt_credentials_provider(),
+        target_throughput=10 * 1000 ** 3 // 8,  # 10 Gb/s in bytes
+        part_size=MULTIPART_CHUNKSIZE,
+        use_ssl=endpoint_url.startswith('https')
+    )
+    serializer = BotocoreCRTRequestSerializer(
+        botocore.session.Session(),
+        {'region_name': region, 'endpoint_url': endpoint_url}
+    )
+    return CRTTransferManager(crt_client, serializer)
+
+def create_large_downloader(
+    s3_client: boto3.client,
+    args: argparse.Namespace
+):
+    """Create a CRT or process pool downloader for ranged multipart GETs."""
+    if crt_available(args):
+        logger.info(
+            "Using AWS CRT for objects of "
+            f"{format_size(MULTIPART_THRESHOLD)} or more"
+        )
+        return create_crt_downloader(s3_client)
+        
+    client_kwargs = {
+        'config': _S3_CONFIG.merge(Config(max_pool_connections=100))
+    }
+    config = ProcessTransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=MULTIPART_CHUNKSIZE,
+        max_request_processes=(os.cpu_count() or 1) * 2
+    )
+    return ProcessPoolDownloader(client_kwargs=client_kwargs, config=config)
+
+def run_downloads(
+    download_tasks: Iterable[Tuple[str, str, int]],
+    s3_client: boto3.client,
+    args: argparse.Namespace
+) -> Tuple[bool, int, int]:
+    """
+    Download a stream of tasks, routing large objects to a CRT client
+    or process pool.
+    
+    Args:
+        download_tasks: (s3_key, local_path, size) tuples
+        s3_client: Boto3 S3 client
+        args: Parsed command line arguments
+        
+    Returns:
+        Tuple of success status, files processed and total size
+    """
+    large_futures = []
+    with create_large_downloader(s3_client, args) as downloader:
+        small_tasks = submit_large_downloads(
+            download_tasks, downloader, large_futures, args
+        )
+        if async_available(args):
+            max_inflight = args.max_workers or ASYNC_MAX_INFLIGHT
+            logger.info(
+                f"Using asyncio with up to {max_inflight} "
+                "in-flight downloads"
+            )
+            transfer_one = functools.partial(
+                download_file_async, bucket=args.bucket
+            )
+            success, total_files, total_size = asyncio.run(
+                run_async_transfers(
+                    small_tasks, transfer_one, "Downloading files",
+                    max_inflight=max_inflight
+                )
+            )
+        else:
+            success, total_files, total_size = download_small_files(
+                small_tasks, s3_client, args
+            )
+        
+        if large_futures:
+            large_ok, large_size = collect_large_downloads(large_futures)
+            success = success and large_ok
+            total_files += len(large_futures)
+            total_size += large_size
+    
+    return success, total_files, total_size
+
+def verify_file(
+    local_path: str,
+    etag: str,
+    part_size: int = MULTIPART_CHUNKSIZE
+) -> Optional[bool]:
+    """
+    Check a downloaded file against its S3 ETag.
+    
+    Single-part ETags are the object's MD5. Multipart ETags are the MD5
+    of the part MD5s plus a part count, so the file is hashed in
+    part_size chunks; the default matches this tool's own uploads. Runs
+    in worker processes, so it must stay at module level.
+    
+    Returns:
+        True if the file matches, False if it does not, or None if the
+        file is missing. A False result may still be an encrypted object
+        or another uploader's part size, see recheck_mismatch()
+    """
+    etag = etag.strip('"')
+    expected_parts = int(etag.partition('-')[2] or 0)
+    file_md5 = hashlib.md5()
+    part_digests = []
+    try:
+        with open(local_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(part_size), b''):
+                if expected_parts:
+                    part_digests.append(hashlib.md5(chunk).digest())
+                else:
+                    file_md5.update(chunk)
+    except FileNotFoundError:
+        return None  # The failed download has already been reported
+        
+    if not expected_parts:
+        return file_md5.hexdigest() == etag
+    digest = hashlib.md5(b''.join(part_digests)).hexdigest()
+    return f"{digest}-{len(part_digests)}" == etag
+
+def recheck_mismatch(
+    s3_client: boto3.client,
+    bucket: str,
+    s3_key: str,
+    local_path: str,
+    etag: str
+) -> Optional[bool]:
+    """
+    Re-check a verify_file() mismatch against the object's metadata.
+    
+    SSE-KMS and SSE-C objects get an opaque ETag, and ListObjectsV2
+    reports neither encryption nor part size, so one HeadObject covers
+    both. For a multipart ETag it asks for part 1, whose ContentLength
+    is the uploader's part size, and rehashes the file with it. This is
+    only called for mismatches, which should be rare.
+    
+    Returns:
+        True or False from hashing with the real part size, False for a
+        genuine mismatch, or None if the ETag cannot be checked
+    """
+    multipart = '-' in etag
+    part = {'PartNumber': 1} if multipart else {}
+    try:
+        response = s3_client.head_object(Bucket=bucket, Key=s3_key, **part)
+    except ClientError:
+        return None  # SSE-C objects cannot be read without their key
+    encryption = response.get('ServerSideEncryption', '')
+    if encryption.startswith('aws:kms') or 'SSECustomerAlgorithm' in response:
+        return None
+    part_size = response['ContentLength']
+    if not multipart or part_size == MULTIPART_CHUNKSIZE:
+        return False
+    return verify_file(local_path, etag, part_size)
+
+def verify_downloads(
+    etags: dict,
+    s3_client: boto3.client,
+    args: argparse.Namespace
+) -> bool:
+    """
+    Verify downloaded files against their ETags.
+    
+    Hashing is CPU bound, so it runs in a process pool with one worker
+    per core, outside the GIL the transfer threads share. Pass
+    --no-multiprocess to hash in this process instead. A mismatch only
+    counts as a failure once recheck_mismatch() has ruled out encryption
+    and another uploader's part size.
+    
+    Args:
+        etags: (S3 key, ETag) tuples keyed by local path
+        s3_client: Boto3 S3 client used to check mismatched objects
+        args: Parsed command line arguments
+        
+    Returns:
+        bool: True if no file failed verification, False otherwise
+    """
+    paths = list(etags)
+    expected = [etag for _, etag in etags.values()]
+    logger.info(f"Verifying {len(paths)} downloaded files")
+    if args.no_multiprocess:
+        results = list(map(verify_file, paths, expected))
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(
+                verify_file, paths, expected, chunksize=64
+            ))
+    results = [
+        recheck_mismatch(
+            s3_client, args.bucket, etags[path][0], path, etags[path][1]
+        ) if ok is False else ok
+        for path, ok in zip(paths, results)
+    ]
+    return report_verification(paths, results)
+
+def report_verification(
+    paths: List[str],
+    results: Iterable[Optional[bool]]
+) -> bool:
+    """Log the outcome of verify_file() calls; return True if none failed."""
+    failed = []
+    unchecked = 0
+    for local_path, ok in zip(paths, results):
+        if ok is None:
+            unchecked += 1
+        elif not ok:
+            failed.append(local_path)
+            
+    if unchecked:
+        logger.warning(
+            f"Could not verify {unchecked} files (SSE-KMS or SSE-C "
+            "encrypted, or file missing)"
+        )
+    if failed:
+        logger.error(
+            f"Verification failed for {len(failed)} files:\n"
+            + '\n'.join(f"  {path}" for path in failed)
+        )
+        return False
+    logger.info(f"Verified {len(paths) - unchecked} files")
+    return True
+
 def download_files(
     args: argparse.Namespace
 ) -> bool:
     """
     Download files from S3 based on command line arguments.
     
+    Objects are downloaded while the listing is still being paged in.
+    Small objects are fetched by a thread pool; objects at or above
+    MULTIPART_THRESHOLD are split into ranged GETs by a process pool.
+    
     Args:
         args: Parsed command line arguments
         
@@ -872,20 +1753,19 @@ def download_files(
             args.bucket, args.prefix = parse_s3_source(args.source)
             
             logger.info(
-                f"{Fore.CYAN}Using source: {args.source} "
+                f"Using source: {args.source} "
                 f"(bucket: {args.bucket}, prefix: {args.prefix})"
-                f"{Style.RESET_ALL}"
             )
         
-        # Configure S3 client
-        s3_client = configure_s3_client()
+        # Get the shared S3 client
+        s3_client = get_s3_client(args)
         
-        # List objects to download
+        # Stream objects to download
         logger.info(
-            f"{Fore.CYAN}Listing objects in bucket {args.bucket} "
-            f"with prefix {args.prefix}{Style.RESET_ALL}"
+            f"Listing objects in bucket {args.bucket} "
+            f"with prefix {args.prefix}"
         )
-        objects = list_s3_objects(
+        objects = iter_s3_objects(
             s3_client, 
             args.bucket, 
             args.prefix,  # Use the parsed prefix, not the full S3 URL
@@ -893,67 +1773,39 @@ def download_files(
             args.filter
         )
         
-        if not objects:
-            logger.warning(
-                f"{Fore.YELLOW}No files found to download{Style.RESET_ALL}"
-            )
-            return True
-            
-        # Log initial file count
-        total_files = len(objects)
-        logger.info(
-            f"{Fore.CYAN}Found {total_files} files to download"
-            f"{Style.RESET_ALL}"
-        )
-        
         # Handle dry run
         if args.dry_run:
             return process_dry_run_download(objects, args.prefix, args)
             
-        # Set up concurrent execution
-        max_workers = min(32, total_files)  # Limit to 32 concurrent downloads
-        logger.info(
-            f"{Fore.CYAN}Using {max_workers} concurrent workers"
-            f"{Style.RESET_ALL}"
-        )
-        
-        # Initialize statistics and prepare tasks
+        # Initialize statistics and download as objects are listed
         start_time = time.time()
+        stats = {'skipped': 0}
+        etags = {} if args.verify else None
         download_tasks = prepare_download_tasks(
-            objects, args.prefix, args.destination
+            objects, args.prefix, args.destination, args.overwrite, stats,
+            etags
         )
-        
-        logger.info(
-            f"{Fore.CYAN}Starting ThreadPoolExecutor with {max_workers} "
-            f"workers{Style.RESET_ALL}"
+        success, total_files, total_size = run_downloads(
+            download_tasks, s3_client, args
         )
+        if etags:
+            success = verify_downloads(etags, s3_client, args) and success
         
-        # Execute downloads concurrently
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit tasks
-            future_to_file = submit_download_tasks(
-                executor, download_tasks, s3_client, args, total_files
-            )
-            
+        if stats['skipped']:
             logger.info(
-                f"{Fore.CYAN}All downloads submitted, waiting for completion"
-                f"{Style.RESET_ALL}"
-            )
-            
-            # Process results
-            success, total_size = process_download_results(
-                future_to_file, total_files
+                f"Skipped {stats['skipped']} existing files "
+                "(use --overwrite to replace them)"
             )
+        elif not total_files:
+            logger.warning("No files found to download")
+            return True
                         
         # Print summary report
         print_summary_report(total_files, total_size, start_time, "download")
         return success
         
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error during download process: {str(e)}"
-            f"{Style.RESET_ALL}"
-        )
+        logger.error(f"Error during download process: {str(e)}")
         return False
 
 def list_bucket_contents(
@@ -971,33 +1823,25 @@ def list_bucket_contents(
     try:
         # Parse source if it's in s3:// format
         if args.source and args.source.startswith('s3://'):
-            # Extract bucket and prefix from s3://bucket/prefix format
-            s3_path = args.source[5:]  # Remove 's3://'
-            parts = s3_path.split('/', 1)  # Split at first '/'
-            
             # Set bucket and prefix from source
-            args.bucket = parts[0]
-            args.prefix = parts[1] if len(parts) > 1 else ''
+            args.bucket, args.prefix = split_s3_url(args.source)
             
             logger.info(
-                f"{Fore.CYAN}Using source: {args.source} "
+                f"Using source: {args.source} "
                 f"(bucket: {args.bucket}, prefix: {args.prefix})"
-                f"{Style.RESET_ALL}"
             )
         
-        # Configure S3 client
-        session = boto3.Session()
-        s3_client = session.client('s3')
+        # Get the shared S3 client
+        s3_client = get_s3_client(args)
         
-        # Use source as prefix if provided, otherwise use prefix
-        prefix = args.source if args.source else args.prefix
+        prefix = args.prefix
         
         logger.info(
-            f"{Fore.CYAN}Listing objects in bucket {args.bucket} "
-            f"with prefix {prefix}{Style.RESET_ALL}"
+            f"Listing objects in bucket {args.bucket} "
+            f"with prefix {prefix}"
         )
         
-        objects = list_s3_objects(
+        objects = iter_s3_objects(
             s3_client, 
             args.bucket, 
             prefix, 
@@ -1005,116 +1849,179 @@ def list_bucket_contents(
             args.filter
         )
         
-        if not objects:
+        # Print objects a page at a time, so memory stays bounded by the
+        # page size and output starts as soon as the first page arrives
+        total_files = 0
+        total_size = 0
+        for batch in iter_batches(objects, 1000):
+            total_files += len(batch)
+            total_size += sum(obj['Size'] for obj in batch)
+            # Emit each page as one log record rather than one per
+            # object, and skip building it when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                # isoformat is about twice as fast as strftime or a
+                # format spec; slicing off the UTC offset keeps the
+                # YYYY-MM-DD HH:MM:SS format
+                lines = [
+                    f"  {obj['Key']} - {format_size(obj['Size'])} - "
+                    f"{obj['LastModified'].isoformat(' ', 'seconds')[:19]}"
+                    for obj in batch
+                ]
+                logger.info('\n'.join(lines))
+        
+        if not total_files:
             logger.warning(
-                f"{Fore.YELLOW}No objects found in bucket {args.bucket} "
-                f"with prefix {prefix}{Style.RESET_ALL}"
+                f"No objects found in bucket {args.bucket} "
+                f"with prefix {prefix}"
             )
             return True
             
-        # Print objects
-        logger.info(
-            f"{Fore.GREEN}Found {len(objects)} objects:{Style.RESET_ALL}"
-        )
-        
-        total_size = 0
-        for obj in objects:
-            s3_key = obj['Key']
-            size = obj['Size']
-            total_size += size
-            last_modified = obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S')
-            logger.info(
-                f"{Fore.CYAN}  {s3_key} - {format_size(size)} - "
-                f"{last_modified}{Style.RESET_ALL}"
-            )
-            
-        logger.info(
-            f"{Fore.GREEN}Total: {len(objects)} objects, "
-            f"{format_size(total_size)}{Style.RESET_ALL}"
-        )
+        logger.info(f"Total: {total_files} objects, {format_size(total_size)}")
         
         return True
         
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error listing bucket contents: {str(e)}"
-            f"{Style.RESET_ALL}"
-        )
+        logger.error(f"Error listing bucket contents: {str(e)}")
         return False
 
 def process_dry_run_delete(
-    objects: List[dict],
+    objects: Iterable[dict],
     bucket: str,
     prefix: str
 ) -> bool:
-    """Process dry run for delete operation."""
-    total_size = sum(obj['Size'] for obj in objects)
+    """Process dry run for delete operation in a single pass."""
+    total_files = 0
+    total_size = 0
+    for obj in objects:
+        total_files += 1
+        total_size += obj['Size']
+        
+    if not total_files:
+        logger.warning("No files found to delete")
+        return True
+        
     logger.info(
-        f"{Fore.CYAN}Dry run - would delete {len(objects)} files "
+        f"Dry run - would delete {total_files} files "
         f"({format_size(total_size)}) from s3://{bucket}/{prefix}"
-        f"{Style.RESET_ALL}"
     )
     return True
 
-def batch_delete_objects(
+def iter_batches(items: Iterable, batch_size: int) -> Iterator[list]:
+    """Yield successive lists of up to batch_size items from an iterable."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def iter_delete_batches(
+    objects: Iterable[dict],
+    batch_size: int
+) -> Iterator[Tuple[List[dict], int]]:
+    """
+    Yield (keys, total size) batches for DeleteObjects.
+    
+    The request's Objects list and the batch size are built in the same
+    pass over each object, so no batch is walked a second time.
+    """
+    keys = []
+    size = 0
+    for obj in objects:
+        keys.append({'Key': obj['Key']})
+        size += obj.get('Size', 0)
+        if len(keys) == batch_size:
+            yield keys, size
+            keys = []
+            size = 0
+    if keys:
+        yield keys, size
+
+def delete_object_batch(
     s3_client: boto3.client,
     bucket: str,
-    objects: List[dict],
-    total_files: int
-) -> Tuple[bool, int]:
-    """Delete objects in batches and return success status and total size."""
-    success = True
-    total_size = 0
+    keys: List[dict]
+) -> int:
+    """Delete one batch of {'Key': ...} entries; return the failures."""
+    # Prepare delete request
+    delete_objects = {
+        'Objects': keys,
+        'Quiet': True  # Only errors are returned
+    }
+    
+    response = s3_client.delete_objects(
+        Bucket=bucket,
+        Delete=delete_objects
+    )
+    
+    # Report all errors in the batch as a single log record
+    errors = response.get('Errors', [])
+    if errors:
+        logger.error(
+            "Batch delete failed for %d keys:\n%s",
+            len(errors),
+            '\n'.join(
+                f"  {error['Key']}: {error['Code']} - {error['Message']}"
+                for error in errors
+            )
+        )
+    return len(errors)
+
+def delete_batch(
+    s3_client: boto3.client,
+    bucket: str,
+    batch: Tuple[List[dict], int]
+) -> Tuple[int, int, int]:
+    """
+    Delete one batch of keys, counting a failed request as all failures.
+    
+    Returns:
+        Tuple of failed keys, keys in the batch and their total size
+    """
+    keys, size = batch
+    try:
+        return delete_object_batch(s3_client, bucket, keys), \
+            len(keys), size
+    except Exception as e:
+        logger.error(f"Error in batch delete: {str(e)}")
+        return len(keys), len(keys), size
+
+def bulk_delete_objects(
+    s3_client: boto3.client,
+    bucket: str,
+    objects: Iterable[dict]
+) -> Tuple[bool, int, int]:
+    """
+    Delete objects in concurrent batches of up to 1000 keys.
+    
+    The listing is paged in on a producer thread that keeps up to 8
+    batches queued, while up to 16 DeleteObjects requests are in flight.
+    Deletion overlaps listing, memory stays bounded regardless of bucket
+    size and wall time is roughly ceil(N / 1000) / 16 round trips.
+    Returns a tuple of success status, files processed and total size
+    deleted.
+    """
+    failures = total_files = total_size = 0
     batch_size = 1000  # Maximum allowed by S3 API
+    max_workers = DELETE_MAX_WORKERS
+    delete_one = functools.partial(delete_batch, s3_client, bucket)
     
-    with tqdm(
-        total=total_files, 
-        desc="Deleting files", 
-        unit="file"
-    ) as pbar:
-        # Process in batches
-        for i in range(0, len(objects), batch_size):
-            batch = objects[i:i + batch_size]
-            
-            try:
-                # Add sizes to total
-                for obj in batch:
-                    total_size += obj.get('Size', 0)
-                
-                # Prepare delete request
-                delete_objects = {
-                    'Objects': [{'Key': obj['Key']} for obj in batch],
-                    'Quiet': True  # Don't return detailed results
-                }
-                
-                # Delete batch
-                response = s3_client.delete_objects(
-                    Bucket=bucket,
-                    Delete=delete_objects
-                )
-                
-                # Check for errors
-                if 'Errors' in response and response['Errors']:
-                    for error in response['Errors']:
-                        logger.error(
-                            f"{Fore.RED}Error deleting {error['Key']}: "
-                            f"{error['Code']} - {error['Message']}"
-                            f"{Style.RESET_ALL}"
-                        )
-                        success = False
-                
-                # Update progress
-                pbar.update(len(batch))
-                
-            except Exception as e:
-                logger.error(
-                    f"{Fore.RED}Error in batch delete: {str(e)}"
-                    f"{Style.RESET_ALL}"
-                )
-                success = False
-                pbar.update(len(batch))
+    with progress_bar(
+        desc="Deleting files", unit="file"
+    ) as pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        batches = prefetch(iter_delete_batches(objects, batch_size), 8)
+        for failed, count, size in bounded_map(
+            executor, delete_one, batches, max_workers * 2
+        ):
+            failures += failed
+            total_files += count
+            total_size += size
+            # Only this thread touches the progress bar, so no lock
+            pbar.update(count)
     
-    return success, total_size
+    if failures:
+        logger.error(f"Failed to delete {failures} files")
+    return failures == 0, total_files, total_size
 
 def delete_files(
     args: argparse.Namespace
@@ -1132,8 +2039,8 @@ def delete_files(
         # Ensure destination is an S3 URL
         if not args.destination or not args.destination.startswith('s3://'):
             logger.error(
-                f"{Fore.RED}Error: --destination must be an S3 URL "
-                f"(s3://bucket/prefix) for delete operation{Style.RESET_ALL}"
+                "Error: --destination must be an S3 URL "
+                "(s3://bucket/prefix) for delete operation"
             )
             return False
             
@@ -1141,16 +2048,15 @@ def delete_files(
         bucket, prefix = parse_s3_source(args.destination)
         
         logger.info(
-            f"{Fore.CYAN}Using destination: {args.destination} "
-            f"(bucket: {bucket}, prefix: {prefix}){Style.RESET_ALL}"
+            f"Using destination: {args.destination} "
+            f"(bucket: {bucket}, prefix: {prefix})"
         )
         
-        # Configure S3 client
-        session = boto3.Session()
-        s3_client = session.client('s3')
+        # Get the shared S3 client
+        s3_client = get_s3_client(args)
         
-        # List objects to delete
-        objects = list_s3_objects(
+        # Stream objects to delete
+        objects = iter_s3_objects(
             s3_client, 
             bucket, 
             prefix, 
@@ -1158,18 +2064,6 @@ def delete_files(
             filter_pattern=args.filter
         )
         
-        if not objects:
-            logger.warning(
-                f"{Fore.YELLOW}No files found to delete{Style.RESET_ALL}"
-            )
-            return True
-            
-        # Log initial file count
-        total_files = len(objects)
-        logger.info(
-            f"{Fore.CYAN}Found {total_files} files to delete{Style.RESET_ALL}"
-        )
-        
         # Handle dry run
         if args.dry_run:
             return process_dry_run_delete(objects, bucket, prefix)
@@ -1177,11 +2071,15 @@ def delete_files(
         # Initialize statistics
         start_time = time.time()
         
-        # Delete objects in batches
-        success, total_size = batch_delete_objects(
-            s3_client, bucket, objects, total_files
+        # Delete objects in concurrent batches as they are listed
+        success, total_files, total_size = bulk_delete_objects(
+            configure_delete_client(), bucket, objects
         )
         
+        if not total_files:
+            logger.warning("No files found to delete")
+            return True
+        
         # Print summary
         print_summary_report(
             total_files, 
@@ -1193,9 +2091,7 @@ def delete_files(
         return success
         
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error: {str(e)}{Style.RESET_ALL}"
-        )
+        logger.error(f"Error: {str(e)}")
         return False
 
 def print_usage_examples() -> None:
@@ -1229,9 +2125,6 @@ def print_usage_examples() -> None:
 def execute_operation(args: argparse.Namespace) -> bool:
     """Execute the requested operation based on source and destination."""
     try:
-        # Configure S3 client
-        s3_client = configure_s3_client()
-        
         # Handle delete operation
         if args.delete:
             # Use source if destination is not provided
@@ -1240,13 +2133,11 @@ def execute_operation(args: argparse.Namespace) -> bool:
                 
             if not args.destination or not args.destination.startswith('s3://'):
                 logger.error(
-                    f"{Fore.RED}Error: Either --source or --destination must be an "
-                    f"S3 URL (s3://bucket/prefix) for delete operation{Style.RESET_ALL}"
+                    "Error: Either --source or --destination must be an "
+                    "S3 URL (s3://bucket/prefix) for delete operation"
                 )
                 return False
-            logger.info(
-                f"{Fore.GREEN}Starting delete operation...{Style.RESET_ALL}"
-            )
+            logger.info("Starting delete operation...")
             return delete_files(args)
         
         # Determine operation type based on source/destination
@@ -1254,30 +2145,41 @@ def execute_operation(args: argparse.Namespace) -> bool:
         is_upload = args.destination and args.destination.startswith('s3://')
         
         if is_download:
-            logger.info(
-                f"{Fore.GREEN}Starting download from S3...{Style.RESET_ALL}"
-            )
+            logger.info("Starting download from S3...")
             return download_files(args)
         elif is_upload:
-            logger.info(
-                f"{Fore.GREEN}Starting upload to S3...{Style.RESET_ALL}"
-            )
+            logger.info("Starting upload to S3...")
             return upload_files(args)
         else:
             logger.error(
-                f"{Fore.RED}Error: Invalid operation. Either source or "
-                f"destination must be an S3 URL{Style.RESET_ALL}"
+                "Error: Invalid operation. Either source or "
+                "destination must be an S3 URL"
             )
             return False
             
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error during operation: {str(e)}{Style.RESET_ALL}"
-        )
+        logger.error(f"Error during operation: {str(e)}")
         return False
 
+def use_forkserver() -> None:
+    """
+    Start worker processes from a fork server where it is available.
+    
+    The large-object process pool starts lazily, when the first large
+    object is listed, which can be while the transfer threads are in the
+    middle of requests. A plain fork at that point can copy a held lock
+    into the child and deadlock it. Setting the start method launches
+    nothing: the fork server starts at the first Process.start(), often
+    after the threads are running, but as a fresh interpreter via
+    fork+exec, so it holds no copied locks. Workers are then forked from
+    that single-threaded server and start clean.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        multiprocessing.set_start_method('forkserver', force=True)
+
 def main() -> int:
     """Main entry point for the application."""
+    use_forkserver()
     parser = setup_argparse()
     args = parser.parse_args()
 
@@ -1301,30 +2203,24 @@ def main() -> int:
     
     # If no arguments but we have env defaults, proceed with defaults
     if not has_args and has_env_defaults:
-        logger.info(
-            f"{Fore.CYAN}Using environment variables as defaults{Style.RESET_ALL}"
-        )
+        logger.info("Using environment variables as defaults")
 
     # If --validate is set, only check credentials and exit
     if args.validate:
-        logger.info(
-            f"{Fore.CYAN}Validating AWS credentials...{Style.RESET_ALL}"
-        )
+        logger.info("Validating AWS credentials...")
         return 0 if validate_aws_credentials() else 1
 
     if not validate_args(args):
         return 1
 
-    if not validate_aws_credentials():
+    if not validate_aws_credentials(args.bucket, get_s3_client(args)):
         return 1
 
     try:
         success = execute_operation(args)
         return 0 if success else 1
     except Exception as e:
-        logger.error(
-            f"{Fore.RED}Error: {str(e)}{Style.RESET_ALL}"
-        )
+        logger.error(f"Error: {str(e)}")
         return 1
 
 if __name__ == '__main__':